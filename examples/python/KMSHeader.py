@@ -108,13 +108,16 @@ Examles:
   Working with decryption:
     kms_information = KMSHeader().get_partial_kms_header(encrypted_binary[:36])
     header = KMSHeader(encrypted_binary)
+    header = KMSHeader.parse_fast(encrypted_binary) # RSA_4096 RSAES_OAEP_SHA_256 only
     symmetric_keys = header.decrypt()
+    symmetric_keys_list = KMSHeader.decrypt_many([header, ...])
     symmetric_ciphertext = encrypted_binary[len(header):]
   Work with encryption:
     header = KMSHeader("arn:...")
     header.add_public_key(pem_encoded_rsa_public_key)
     header.encrypt(symmetric_keys)
     header.to_binary() + symmetric_ciphertext
+    headers = KMSHeader.encrypt_many("arn:...", public_pem, [symmetric_keys, ...])
 
 Iterating and migrating KMS header blobs:
   Multiple features of the KMS header have been included in consideration of
@@ -162,25 +165,56 @@ Recommended symmetric algorithm:
 """
 
 import base64
-import binascii
+import concurrent.futures
+import copy
+import functools
 import os
 import re
+import threading
+import uuid
 
 # optional RSA encrypt
 try:
     from cryptography.hazmat.primitives import asymmetric
     from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives import serialization
+
+    # OAEP padding is immutable so one instance per algorithm is shared
+    _OAEP_PADDING = {
+        algorithm: asymmetric.padding.OAEP(
+            mgf=asymmetric.padding.MGF1(algorithm=hash_algorithm),
+            algorithm=hash_algorithm,
+            label=None,
+        )
+        for algorithm, hash_algorithm in [
+            ("RSAES_OAEP_SHA_1", hashes.SHA1()),
+            ("RSAES_OAEP_SHA_256", hashes.SHA256()),
+        ]
+    }
 except ModuleNotFoundError:
     pass
 
 # optional decrypt with KMS
 try:
     import boto3
+    import botocore.config
 except ModuleNotFoundError:
     pass
 
 
+@functools.lru_cache(maxsize=64)
+def _load_pem_from_str(public_pem):
+    return serialization.load_pem_public_key(public_pem.encode("utf-8"))
+
+
+# mtime, size, and inode are part of the cache key so that an edited or
+# replaced key file is reloaded
+@functools.lru_cache(maxsize=64)
+def _load_pem_from_path(public_pem_path, mtime, size, inode):
+    with open(public_pem_path, "rb") as key_file:
+        return serialization.load_pem_public_key(key_file.read())
+
+
 class KMSHeader:
     """Creates an instance of a KMS header.
 
@@ -202,35 +236,45 @@ class KMSHeader:
       ValueError: If any argument provided is not valid.
     """
 
+    __slots__ = (
+        "algorithm",
+        "arn",
+        "cipher_data",
+        "key_spec",
+        "public_key",
+        "version",
+        "_max_plain",
+    )
+
     # 3-byte region (1 - major_region, 2 - cardinal_endpoint, 3 - an integer)
     major_region = {
-        "af": "00",
-        "ap": "01",
-        "ca": "02",
-        "eu": "03",
-        "il": "04",
-        "me": "05",
-        "sa": "06",
-        "us": "07",
-        "us-gov": "08",
+        "af": 0x00,
+        "ap": 0x01,
+        "ca": 0x02,
+        "eu": 0x03,
+        "il": 0x04,
+        "me": 0x05,
+        "sa": 0x06,
+        "us": 0x07,
+        "us-gov": 0x08,
     }
     cardinal_endpoint = {
-        "north": "00",
-        "east": "01",
-        "south": "02",
-        "west": "03",
-        "central": "04",
-        "northeast": "05",
-        "southeast": "06",
-        "southwest": "07",
-        "northwest": "08",
+        "north": 0x00,
+        "east": 0x01,
+        "south": 0x02,
+        "west": 0x03,
+        "central": 0x04,
+        "northeast": 0x05,
+        "southeast": 0x06,
+        "southwest": 0x07,
+        "northwest": 0x08,
     }
     algorithms = {
-        "RSA_2048": "01",
-        "RSA_3072": "02",
-        "RSA_4096": "03",
-        "RSAES_OAEP_SHA_1": "10",
-        "RSAES_OAEP_SHA_256": "20",
+        "RSA_2048": 0x01,
+        "RSA_3072": 0x02,
+        "RSA_4096": 0x03,
+        "RSAES_OAEP_SHA_1": 0x10,
+        "RSAES_OAEP_SHA_256": 0x20,
     }
     algorithms_byte_size = {
         "RSAES_OAEP_SHA_1": 42,
@@ -238,8 +282,20 @@ class KMSHeader:
     }
     key_specs_byte_size = {"RSA_2048": 256, "RSA_3072": 384, "RSA_4096": 512}
 
+    # reverse lookups keyed by the integer value of a header byte
+    _major_region_rev = {v: k for k, v in major_region.items()}
+    _cardinal_endpoint_rev = {v: k for k, v in cardinal_endpoint.items()}
+    _algorithms_rev = {v: k for k, v in algorithms.items()}
+    _rsa_4096_oaep_sha_256 = algorithms["RSA_4096"] | algorithms["RSAES_OAEP_SHA_256"]
+
     # binary data which was RSA encrypted
     arn_regex = r"^arn:aws:kms:([^:]+):([^:]+):key/([-0-9a-f]{36})$"
+    _arn_re = re.compile(arn_regex)
+    _region_re = re.compile(r"(.*)-([a-z]+)-([0-9]+)")
+
+    # boto3 KMS clients shared across instances; see _get_kms_client
+    _kms_clients = {}
+    _kms_clients_lock = threading.Lock()
 
     def __init__(
         self, arn_or_header=None, algorithm="RSAES_OAEP_SHA_256", key_spec=None
@@ -250,11 +306,14 @@ class KMSHeader:
         self.cipher_data = None
         self.key_spec = None
         self.public_key = None
-        hash_algs = ["RSAES_OAEP_SHA_1", "RSAES_OAEP_SHA_256"]
-        key_specs = ["RSA_2048", "RSA_3072", "RSA_4096"]
-        if algorithm not in hash_algs:
+        self._max_plain = None
+        hash_algs = self.algorithms_byte_size
+        key_specs = self.key_specs_byte_size
+        if not isinstance(algorithm, str) or algorithm not in hash_algs:
             raise ValueError("algorithm must be one of: %s" % ", ".join(hash_algs))
-        if key_spec is not None and key_spec not in key_specs:
+        if key_spec is not None and (
+            not isinstance(key_spec, str) or key_spec not in key_specs
+        ):
             raise ValueError("key_spec must be one of: %s" % ", ".join(key_specs))
         self.add_algorithm(algorithm)
         self.add_algorithm(key_spec)
@@ -273,22 +332,17 @@ class KMSHeader:
             raise ValueError(
                 "arn_or_header must be 35-bytes or larger when not type string."
             )
-        if data_size >= 40:
-            arn_data = binascii.hexlify(arn_or_header[:40]).decode()
-        elif data_size >= 36:
-            arn_data = binascii.hexlify(arn_or_header[:36]).decode()
-        else:
-            arn_data = binascii.hexlify(arn_or_header[:35]).decode()
-        # assume binary data
-        self.arn = self.__hex_to_kms_arn(arn_data[:70])
+        # assume binary data; slices of a memoryview are not copied
+        data = memoryview(arn_or_header)
+        self.arn = self.__bin_to_kms_arn(data[:35])
         if data_size >= 36:
-            self.__add_algorithm_hex(arn_data[70:72])
+            self.__add_algorithm(data[35])
         if self.key_spec is None or data_size < 40:
             return
-        self.version = self.__reghex_to_int(arn_data[72:76])
+        self.version = int.from_bytes(data[36:38], "big")
         max_header_bytes = 40 + self.__get_key_bytes()
         if data_size >= max_header_bytes:
-            self.cipher_data = arn_or_header[40:max_header_bytes]
+            self.cipher_data = bytes(data[40:max_header_bytes])
 
     def __len__(self):
         """Get the current size in bytes of the binary KMS Header data.
@@ -328,6 +382,38 @@ class KMSHeader:
         """
         return cls(base64.b64decode(b64_data))
 
+    @classmethod
+    def parse_fast(cls, data):
+        """Create an instance from an RSA_4096 RSAES_OAEP_SHA_256 KMS header.
+
+        A specialized KMSHeader(data) for bulk decryption where every blob is
+        known to use RSA_4096 with RSAES_OAEP_SHA_256, the default algorithm.
+        Only the length and algorithm byte are checked.
+
+        Args:
+          data: bytes of at least 552 bytes (a full RSA_4096 KMS header).
+
+        Returns:
+          An instance of KMSHeader.
+
+        Raises:
+          ValueError: If data is not an RSA_4096 RSAES_OAEP_SHA_256 KMS header.
+        """
+        if len(data) < 552 or data[35] != cls._rsa_4096_oaep_sha_256:
+            raise ValueError("data is not an RSA_4096 RSAES_OAEP_SHA_256 KMS header.")
+        header = cls.__new__(cls)
+        header.algorithm = "RSAES_OAEP_SHA_256"
+        header.key_spec = "RSA_4096"
+        header.public_key = None
+        header._max_plain = (
+            cls.key_specs_byte_size["RSA_4096"]
+            - cls.algorithms_byte_size["RSAES_OAEP_SHA_256"]
+        )
+        header.arn = header.__bin_to_kms_arn(data[:35])
+        header.version = int.from_bytes(data[36:38], "big")
+        header.cipher_data = bytes(data[40:552])
+        return header
+
     def to_binary(self):
         """
         Export the current KMS header as binary data.
@@ -342,9 +428,7 @@ class KMSHeader:
         if self.key_spec is not None:
             header_data += self.__algorithm_to_bin()
             # version + 2 bytes unused reserve (0000)
-            header_data += binascii.unhexlify(
-                self.__regint_to_hex(self.version, 4) + "0000"
-            )
+            header_data += self.version.to_bytes(2, "big") + b"\x00\x00"
             if self.cipher_data is not None:
                 header_data += self.cipher_data
         return header_data
@@ -399,18 +483,18 @@ class KMSHeader:
             )
         self.cipher_data = cipher_data
 
-    def __add_algorithm_hex(self, algorithm_hex):
-        alg_id = self.__reghex_to_int(algorithm_hex)
-        specs = self.__reghex_to_int("0f")
-        algs = self.__reghex_to_int("f0")
-        key_spec_id = alg_id & specs
-        algorithm_id = alg_id & algs
-        if key_spec_id > 0:
-            key_spec_hex = self.__regint_to_hex(key_spec_id)
-            self.key_spec = self.__key_by_value(self.algorithms, key_spec_hex)
-        if algorithm_id > 0:
-            alg_hex = self.__regint_to_hex(algorithm_id)
-            self.algorithm = self.__key_by_value(self.algorithms, alg_hex)
+    def __add_algorithm(self, alg_id):
+        key_spec, algorithm = self.__split_algorithm(alg_id)
+        if key_spec is not None:
+            self.key_spec = key_spec
+        if algorithm is not None:
+            self.algorithm = algorithm
+        # bytes encrypt() accepts; resolved here so encrypt() has no lookups
+        if self.key_spec is not None and self.algorithm is not None:
+            self._max_plain = (
+                self.key_specs_byte_size[self.key_spec]
+                - self.algorithms_byte_size[self.algorithm]
+            )
 
     def set_version(self, version=None):
         """
@@ -453,14 +537,12 @@ class KMSHeader:
         """
         if algorithm is None:
             return
-        if not isinstance(algorithm, str) or algorithm not in list(
-            self.algorithms.keys()
-        ):
+        if not isinstance(algorithm, str) or algorithm not in self.algorithms:
             raise ValueError(
                 "algorithm must be a string.  Value one of: %s"
-                % (", ".join(list(self.algorithms.keys())))
+                % (", ".join(self.algorithms))
             )
-        self.__add_algorithm_hex(self.algorithms[algorithm])
+        self.__add_algorithm(self.algorithms[algorithm])
 
     def add_arn(self, arn=None):
         """
@@ -472,17 +554,12 @@ class KMSHeader:
         Raises:
           ValueError: If not a proper KMS ARN format.
         """
-        if not isinstance(arn, str) or not re.search(self.arn_regex, arn):
+        if not isinstance(arn, str) or not self._arn_re.match(arn):
             raise ValueError(
                 "arn format does not match.  It must match regex: %s" % self.arn_regex
             )
-        backup = self.arn
-        try:
-            self.arn = arn
-            self.to_binary()
-        except ValueError:
-            self.arn = backup
-            raise
+        self.__validate_arn(arn)
+        self.arn = arn
 
     def get_cipher_data(self):
         """
@@ -515,26 +592,22 @@ class KMSHeader:
                 "partial_binary_kms_data is expected to be between 16 or more bytes (after 40 bytes data is ignored)."
             )
         data_size = len(partial_binary_kms_data)
-        max_header_bytes_size = 38
-        end_slice = (
-            max_header_bytes_size if data_size >= max_header_bytes_size else data_size
-        )
-        arn_hex = binascii.hexlify(partial_binary_kms_data[:end_slice]).decode()
-        kms_information = {"keyid": self.__hex_to_keyid(arn_hex[:32])}
+        data = memoryview(partial_binary_kms_data)
+        kms_information = {"keyid": self.__bin_to_keyid(data[:16])}
         if data_size >= 32:
-            kms_information["account"] = self.__hex_to_account(arn_hex[32:64])
+            kms_information["account"] = self.__bin_to_account(data[16:32])
         if data_size >= 35:
-            kms_information["region"] = self.__hex_to_region(arn_hex[64:70])
+            kms_information["region"] = self.__bin_to_region(data[32:35])
             kms_information["kms_arn"] = "arn:aws:kms:%s:%s:key/%s" % (
                 kms_information["region"],
                 kms_information["account"],
                 kms_information["keyid"],
             )
         if data_size >= 36:
-            kms_information["algorithm"] = self.__get_algorithm(arn_hex[70:72])
+            kms_information["algorithm"] = self.__get_algorithm(data[35])
         if data_size >= 38:
-            kms_information["version"] = self.__reghex_to_int(arn_hex[72:76])
-        # arn_hex 76:80 is unused and assumed empty
+            kms_information["version"] = int.from_bytes(data[36:38], "big")
+        # bytes 38:40 are unused and assumed empty
         return kms_information
 
     def encrypt(self, plain_data):
@@ -558,29 +631,55 @@ class KMSHeader:
             raise TypeError("plain_data expected to be bytes.")
         if self.public_key is None:
             raise FileNotFoundError("public_key has not be added.  Cannot encrypt.")
-        max_data = (
-            self.public_key.key_size / 8 - self.algorithms_byte_size[self.algorithm]
-        )
-        if len(plain_data) > max_data:
+        if len(plain_data) > self._max_plain:
             raise ValueError(
                 "You attempted to encrypt %d bytes but you cannot encrypt more than %d bytes with %s %s."
-                % (len(plain_data), max_data, self.key_spec, self.algorithm)
+                % (len(plain_data), self._max_plain, self.key_spec, self.algorithm)
             )
-        hash_algorithm = None
-        if self.algorithm == "RSAES_OAEP_SHA_256":
-            hash_algorithm = hashes.SHA256()
-        elif self.algorithm == "RSAES_OAEP_SHA_1":
-            hash_algorithm = hashes.SHA1()
-        cipher_data = self.public_key.encrypt(
-            plain_data,
-            asymmetric.padding.OAEP(
-                mgf=asymmetric.padding.MGF1(algorithm=hash_algorithm),
-                algorithm=hash_algorithm,
-                label=None,
-            ),
-        )
+        cipher_data = self.public_key.encrypt(plain_data, _OAEP_PADDING[self.algorithm])
         self.add_cipher_data(cipher_data)
 
+    @classmethod
+    def encrypt_many(
+        cls,
+        arn,
+        public_pem,
+        plain_datas,
+        algorithm="RSAES_OAEP_SHA_256",
+        max_workers=None,
+    ):
+        """Encrypt many payloads with the same RSA public key concurrently.
+
+        The public key is loaded once and shared by every header.  RSA
+        encryption releases the GIL inside OpenSSL so threads scale with CPU
+        cores.
+
+        Args:
+          arn: An ARN for a KMS key.
+          public_pem: See KMSHeader.add_public_key(public_pem).
+          plain_datas: An iterable of bytes to be encrypted by RSA.
+          algorithm: A supported algorithm KMS would use to decrypt.
+          max_workers: Maximum number of threads; defaults to the CPU count.
+
+        Returns:
+          A list of KMSHeader instances in the same order as plain_datas.
+
+        Raises:
+          See KMSHeader.encrypt(plain_data) and KMSHeader.add_public_key(public_pem).
+        """
+        template = cls(arn, algorithm)
+        template.add_public_key(public_pem)
+
+        def encrypt(plain_data):
+            header = copy.copy(template)
+            header.encrypt(plain_data)
+            return header
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(encrypt, plain_datas))
+
     def add_public_key(self, public_pem):
         """
         Load an RSA public key so that data can be encrypted.
@@ -596,12 +695,12 @@ class KMSHeader:
         if isinstance(public_pem, asymmetric.rsa.RSAPublicKey):
             self.public_key = public_pem
         elif isinstance(public_pem, str) and "-----BEGIN PUBLIC KEY-----" in public_pem:
-            self.public_key = serialization.load_pem_public_key(
-                public_pem.encode("utf-8")
+            self.public_key = _load_pem_from_str(public_pem)
+        elif self.__may_be_path(public_pem) and os.path.exists(public_pem):
+            key_stat = os.stat(public_pem)
+            self.public_key = _load_pem_from_path(
+                public_pem, key_stat.st_mtime_ns, key_stat.st_size, key_stat.st_ino
             )
-        elif os.path.exists(public_pem):
-            with open(public_pem, "rb") as key_file:
-                self.public_key = serialization.load_pem_public_key(key_file.read())
         else:
             raise ValueError(
                 "public_pem does not appear to contain a PEM encoded public key."
@@ -612,6 +711,12 @@ class KMSHeader:
             self.public_key = backup
             raise
 
+    # multi-line or very long text is not a file path; avoids a stat() call
+    def __may_be_path(self, public_pem):
+        if not isinstance(public_pem, str):
+            return True
+        return "\n" not in public_pem and len(public_pem) < 4096
+
     def decrypt(self):
         """Decrypt the cipher_data using KMS.
 
@@ -621,11 +726,81 @@ class KMSHeader:
         Raises:
           ValueError: if arn, agorithm, or cipher_data is None.
         """
+        return self.__kms_decrypt(self._get_kms_client(self.__get_region()))
+
+    @classmethod
+    def decrypt_many(cls, headers, max_workers=16):
+        """Decrypt the cipher_data of many KMS headers concurrently using KMS.
+
+        KMS has no bulk decrypt API so each header is still one KMS request.
+        Requests are issued from a thread pool sharing one KMS client per
+        region.  KMS request quotas for your account bound how high
+        max_workers is useful.  Throttled requests are retried according to
+        your boto3 retry configuration (AWS_RETRY_MODE, AWS_MAX_ATTEMPTS, or
+        ~/.aws/config); the standard or adaptive retry mode is recommended.
+
+        Args:
+          headers: An iterable of KMSHeader instances with cipher_data loaded.
+          max_workers: Maximum number of concurrent KMS decrypt requests.
+
+        Returns:
+          A list of plain data in the same order as headers.
+
+        Raises:
+          ValueError: if arn, agorithm, or cipher_data is None for any header.
+        """
+        headers = list(headers)
+        kms_clients = [cls._get_kms_client(h.__get_region()) for h in headers]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(header.__kms_decrypt, kms_client)
+                for header, kms_client in zip(headers, kms_clients)
+            ]
+            return [future.result() for future in futures]
+
+    @classmethod
+    def _get_kms_client(cls, region):
+        """Get a KMS client for region which is shared by all KMS headers.
+
+        Creating a boto3 client is expensive so one is kept per region and
+        reused along with its pooled TLS connections.  Clients are per process;
+        a forked child process creates its own.
+
+        Args:
+          region: An AWS region such as us-east-1.
+
+        Returns:
+          A boto3 KMS client.
+        """
+        # creating clients from the default boto3 session is not thread-safe
+        with cls._kms_clients_lock:
+            if region not in cls._kms_clients:
+                cls._kms_clients[region] = boto3.client(
+                    "kms",
+                    region_name=region,
+                    config=botocore.config.Config(
+                        max_pool_connections=32,
+                        tcp_keepalive=True,
+                    ),
+                )
+            return cls._kms_clients[region]
+
+    @classmethod
+    def _reset_kms_clients(cls):
+        """Forget shared KMS clients.
+
+        Called in a forked child process because boto3 clients and their
+        pooled connections must not be shared across processes.
+        """
+        cls._kms_clients = {}
+        cls._kms_clients_lock = threading.Lock()
+
+    def __get_region(self):
         if None in [self.arn, self.key_spec, self.cipher_data]:
             raise ValueError("arn, algorithm, and cihper_data need to be loaded.")
-        match = re.search(self.arn_regex, self.arn)
-        region = match.group(1)
-        kms_client = boto3.client("kms", region_name=region)
+        return self._arn_re.match(self.arn).group(1)
+
+    def __kms_decrypt(self, kms_client):
         response = kms_client.decrypt(
             KeyId=self.arn,
             CiphertextBlob=self.cipher_data,
@@ -634,131 +809,114 @@ class KMSHeader:
         return response["Plaintext"]
 
     def __algorithm_to_bin(self):
-        alg_int = self.__reghex_to_int(self.algorithms[self.algorithm])
-        alg_int |= self.__reghex_to_int(self.algorithms[self.key_spec])
-        return binascii.unhexlify(self.__regint_to_hex(alg_int))
-
-    def __get_algorithm(self, alg_hex):
-        algorithms = []
-        alg_id = self.__reghex_to_int(alg_hex)
-        specs = self.__reghex_to_int("0f")
-        algs = self.__reghex_to_int("f0")
-        key_spec_id = alg_id & specs
-        algorithm_id = alg_id & algs
-        if key_spec_id > 0:
-            algorithms.append(
-                self.__key_by_value(self.algorithms, self.__regint_to_hex(key_spec_id))
-            )
-        if algorithm_id:
-            algorithms.append(
-                self.__key_by_value(self.algorithms, self.__regint_to_hex(algorithm_id))
-            )
-        return algorithms
+        return bytes([self.algorithms[self.algorithm] | self.algorithms[self.key_spec]])
+
+    def __get_algorithm(self, alg_id):
+        return [name for name in self.__split_algorithm(alg_id) if name is not None]
+
+    # low nibble is the key spec and high nibble is the algorithm
+    def __split_algorithm(self, alg_id):
+        key_spec_id = alg_id & 0x0F
+        algorithm_id = alg_id & 0xF0
+        try:
+            key_spec = self._algorithms_rev[key_spec_id] if key_spec_id else None
+            algorithm = self._algorithms_rev[algorithm_id] if algorithm_id else None
+        except KeyError:
+            raise ValueError("An invalid algorithm was found in the KMS header.")
+        return key_spec, algorithm
 
     def __get_key_bytes(self):
         return self.key_specs_byte_size[self.key_spec]
 
-    def __key_by_value(self, dictionary, value):
-        return list(dictionary.keys())[list(dictionary.values()).index(value)]
-
     # last byte is regional integer
-    def __regint_to_hex(self, region_int, desired_size=2):
-        region_hex = "{0:x}".format(int(region_int))
-        buffer = desired_size - len(region_hex)
-        if buffer > 0:
-            region_hex = ("0" * buffer) + region_hex
-        return region_hex
-
-    def __reghex_to_int(self, region_hex):
-        return int.from_bytes(binascii.unhexlify(region_hex), "big")
-
-    def __region_to_hex(self, region):
-        match = re.search(r"(.*)-([a-z]+)-([0-9]+)", region)
-        region_hex = "".join(
+    @classmethod
+    def __region_to_bin(cls, region):
+        match = cls._region_re.match(region)
+        if not match:
+            raise ValueError("region format does not match.")
+        return bytes(
             [
-                self.major_region[match.group(1)],
-                self.cardinal_endpoint[match.group(2)],
-                self.__regint_to_hex(match.group(3)),
+                cls.major_region[match.group(1)],
+                cls.cardinal_endpoint[match.group(2)],
+                int(match.group(3)),
             ]
         )
-        return region_hex
 
-    def __hex_to_region(self, region_hex):
-        region = "-".join(
-            [
-                self.__key_by_value(self.major_region, region_hex[:2]),
-                self.__key_by_value(self.cardinal_endpoint, region_hex[2:4]),
-                str(self.__reghex_to_int(region_hex[4:])),
-            ]
-        )
+    def __bin_to_region(self, region_bin):
+        try:
+            region = "-".join(
+                [
+                    self._major_region_rev[region_bin[0]],
+                    self._cardinal_endpoint_rev[region_bin[1]],
+                    str(region_bin[2]),
+                ]
+            )
+        except KeyError:
+            raise ValueError("An invalid region was found in the KMS header.")
         return region
 
-    def __keyid_to_hex(self, keyid):
-        return keyid.replace("-", "")
+    @classmethod
+    def __keyid_to_bin(cls, keyid):
+        keyid_bin = bytes.fromhex(keyid.replace("-", ""))
+        if len(keyid_bin) != 16:
+            raise ValueError("16-byte Key ID expected.")
+        return keyid_bin
+
+    def __bin_to_keyid(self, keyid_bin):
+        return str(uuid.UUID(int=int.from_bytes(keyid_bin, "big")))
 
-    def __hex_to_keyid(self, keyid_hex):
-        match = re.search(r"^[0-9a-f]{32}$", keyid_hex)
-        if not match:
-            raise AssertionError(
-                "16-byte Key ID as a hex string was expected but not found (32 chars)."
-            )
-        keyid = "-".join(
-            [
-                keyid_hex[:8],
-                keyid_hex[8:12],
-                keyid_hex[12:16],
-                keyid_hex[16:20],
-                keyid_hex[20:],
-            ]
-        )
-        return keyid
+    @classmethod
+    def __account_to_bin(cls, account):
+        return int(account).to_bytes(16, "big")
 
-    def __account_to_hex(self, account):
-        account_hex = self.__regint_to_hex(account, 32)
-        return account_hex
+    def __bin_to_account(self, account_bin):
+        return str(int.from_bytes(account_bin, "big"))
 
-    def __hex_to_account(self, account_hex):
-        return str(self.__reghex_to_int(account_hex))
+    def __validate_arn(self, arn):
+        self.__kms_arn_to_bin_parts(arn)
 
-    def __kms_arn_to_hex(self, arn):
-        match = re.search(self.arn_regex, arn)
+    @classmethod
+    def __kms_arn_to_bin_parts(cls, arn):
+        match = cls._arn_re.match(arn)
         if not match:
             raise ValueError("KMS arn expected.")
         region = match.group(1)
         account = match.group(2)
         keyid = match.group(3)
         try:
-            region = self.__region_to_hex(region)
-        except KeyError:
+            region = cls.__region_to_bin(region)
+        except (KeyError, ValueError):
             raise ValueError("An invalid region was provided in the arn.")
         try:
-            account = self.__account_to_hex(account)
-        except ValueError:
+            account = cls.__account_to_bin(account)
+        except (OverflowError, ValueError):
             raise ValueError("An invalid account number was provided in the arn.")
         try:
-            keyid = self.__keyid_to_hex(keyid)
-        except binascii.Error:
+            keyid = cls.__keyid_to_bin(keyid)
+        except ValueError:
             raise ValueError("An invalid keyid was provided in the arn.")
+        return keyid, account, region
 
-        arn_hex = "".join(
-            [
-                keyid,
-                account,
-                region,
-            ]
-        )
-        return arn_hex
-
-    def __hex_to_kms_arn(self, arn_hex):
-        match = re.search(r"^[0-9a-f]{70}$", arn_hex)
-        if not match:
-            raise ValueError("35-byte arn hex expected (70 chars).")
+    def __bin_to_kms_arn(self, arn_bin):
+        if len(arn_bin) != 35:
+            raise ValueError("35-byte arn expected.")
         arn = "arn:aws:kms:%s:%s:key/%s" % (
-            self.__hex_to_region(arn_hex[64:]),
-            self.__hex_to_account(arn_hex[32:64]),
-            self.__hex_to_keyid(arn_hex[:32]),
+            self.__bin_to_region(arn_bin[32:35]),
+            self.__bin_to_account(arn_bin[16:32]),
+            self.__bin_to_keyid(arn_bin[:16]),
         )
         return arn
 
-    def __kms_arn_to_bin(self, arn):
-        return binascii.unhexlify(self.__kms_arn_to_hex(arn))
+    @classmethod
+    def __kms_arn_to_bin(cls, arn):
+        return cls.__arn_bin(arn)
+
+    # encoded ARNs are shared across instances; invalid ARNs raise and are not cached
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def __arn_bin(arn):
+        return b"".join(KMSHeader.__kms_arn_to_bin_parts(arn))
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=KMSHeader._reset_kms_clients)